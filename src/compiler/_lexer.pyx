@@ -0,0 +1,85 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# _lexer.pyx - Cython build of the rerec tokenizer
+#
+# Scans the UTF-8 source buffer (bytes, mmap, ...) directly; equal
+# identifiers and strings share one Token, as in the regex tokenizer. Build
+# with `make lexer`; rerec.py falls back to its regex tokenizer when this
+# extension is not available.
+from cpython.unicode cimport PyUnicode_DecodeASCII, PyUnicode_DecodeUTF8
+from libc.string cimport memchr
+
+cdef extern from "Python.h":
+    # Locale-independent ASCII classifiers from pyctype.h
+    bint isalnum "Py_ISALNUM"(unsigned char c)
+    bint isalpha "Py_ISALPHA"(unsigned char c)
+    bint isspace "Py_ISSPACE"(unsigned char c)
+
+
+def tokenize(const unsigned char[::1] source, token, dict punct, dict keywords,
+             int ident_tid, int string_tid):
+    cdef Py_ssize_t n = source.shape[0]
+    cdef const unsigned char *buf = &source[0] if n else NULL
+    cdef Py_ssize_t pos = 0, start
+    cdef const unsigned char *eol
+    cdef unsigned char c
+    cdef list tokens = []
+    # The keyword and punctuation tables never change shape, so fold them in
+    # up front: keywords pre-seed the interning cache (one lookup per
+    # identifier) and single-byte punctuation becomes a table indexed by byte
+    # value; the two-byte arrow is matched on its own below.
+    cdef dict cache = dict(keywords)
+    cdef list punct_by_byte = [None] * 256
+    for ch, tok in punct.items():
+        if len(ch) == 1:
+            punct_by_byte[ord(ch)] = tok
+    arrow = punct['->']
+
+    while pos < n:
+        c = buf[pos]
+        if isspace(c):
+            # Skip the whole run (indentation, blank lines) in one go
+            pos += 1
+            while pos < n and isspace(buf[pos]):
+                pos += 1
+
+        elif c == c'/' and pos + 1 < n and buf[pos + 1] == c'/':
+            eol = <const unsigned char *>memchr(buf + pos, c'\n', n - pos)
+            pos = eol - buf if eol != NULL else n
+
+        elif isalpha(c) or c == c'_':
+            start = pos
+            while pos < n and (isalnum(buf[pos]) or buf[pos] == c'_'):
+                pos += 1
+            ident = PyUnicode_DecodeASCII(<const char *>buf + start, pos - start, NULL)
+            tok = cache.get(ident)
+            if tok is None:
+                tok = cache[ident] = token(ident_tid, ident)
+            tokens.append(tok)
+
+        elif c == c'"':
+            start = pos
+            pos += 1
+            while pos < n and buf[pos] != c'"':
+                pos += 1
+            if pos == n:
+                # Unterminated string: skip the quote, like the regex tokenizer
+                pos = start + 1
+                continue
+            pos += 1
+            value = PyUnicode_DecodeUTF8(<const char *>buf + start, pos - start, NULL)
+            tok = cache.get(value)
+            if tok is None:
+                tok = cache[value] = token(string_tid, value)
+            tokens.append(tok)
+
+        elif c == c'-' and pos + 1 < n and buf[pos + 1] == c'>':
+            tokens.append(arrow)
+            pos += 2
+
+        else:
+            tok = punct_by_byte[c]
+            if tok is not None:
+                tokens.append(tok)
+            pos += 1
+
+    return tokens
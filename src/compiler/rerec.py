@@ -2,236 +2,277 @@
 import sys
 import os
 import argparse
+import contextlib
+import hashlib
+import mmap
+import re
+import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 
 # --- Token and AST Definitions ---
-@dataclass
+# Token type codes; the parser compares these instead of token text
+(T_EOF, T_IDENT, T_STRING,
+ T_MODULE, T_IMPORT, T_FUNC, T_RETURN,
+ T_SEMI, T_LBRACE, T_RBRACE, T_LPAREN, T_RPAREN, T_COMMA, T_DOT, T_COLON,
+ T_ARROW) = range(16)
+
+TOKEN_NAMES = ['EOF', 'IDENT', 'STRING',
+               'MODULE', 'IMPORT', 'FUNC', 'RETURN',
+               ';', '{', '}', '(', ')', ',', '.', ':',
+               '->']
+
+@dataclass(frozen=True, slots=True)
 class Token:
-    type: str
+    tid: int
     value: str
     
     def __repr__(self):
-        return f"Token({self.type}, '{self.value}')"
+        return f"Token({TOKEN_NAMES[self.tid]}, '{self.value}')"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Node:
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Module(Node):
     name: str
     imports: List[str]
     functions: List['Function']
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Function(Node):
     name: str
     params: List[tuple]
     returns: str
     body: List[Node]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Call(Node):
     func: str
     args: List[Node]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StringLiteral(Node):
     value: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Return(Node):
     value: Node
 
 # --- Lexer ---
-class Lexer:
-    KEYWORDS = {'module', 'import', 'func', 'return'}
-    
-    def __init__(self, source):
-        self.source = source
-        self.pos = 0
-        self.current_char = self.source[self.pos] if self.source else None
-    
-    def advance(self):
-        self.pos += 1
-        if self.pos < len(self.source):
-            self.current_char = self.source[self.pos]
-        else:
-            self.current_char = None
-    
-    def skip_whitespace(self):
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
-    
-    def get_identifier(self):
-        result = ''
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        return result
-    
-    def get_string(self):
-        result = ''
-        self.advance()  # Skip opening quote
-        while self.current_char is not None and self.current_char != '"':
-            result += self.current_char
-            self.advance()
-        self.advance()  # Skip closing quote
-        return f'"{result}"'
+KEYWORDS = {'module': T_MODULE, 'import': T_IMPORT, 'func': T_FUNC, 'return': T_RETURN}
+PUNCTUATION = {';': T_SEMI, '{': T_LBRACE, '}': T_RBRACE, '(': T_LPAREN,
+               ')': T_RPAREN, ',': T_COMMA, '.': T_DOT, ':': T_COLON,
+               '->': T_ARROW}
+
+# Tokens without a payload are immutable, so one shared instance of each is
+# handed out instead of allocating a new Token per occurrence
+_PUNCT_TOKENS = {c: Token(tid, c) for c, tid in PUNCTUATION.items()}
+_KW_TOKENS = {k: Token(tid, k) for k, tid in KEYWORDS.items()}
+_EOF_TOKEN = Token(T_EOF, '')
+
+# The tokenizer works on the raw UTF-8 bytes of the source, so the shared
+# tokens are also keyed by their encoded text
+_FIXED_TOKENS = {t.value.encode(): t for t in (*_PUNCT_TOKENS.values(), *_KW_TOKENS.values())}
+_SLASH, _QUOTE = b'/"'
+
+# findall hands back every lexeme in one call; whitespace and any other
+# unrecognised byte is skipped by the regex search itself
+_TOKEN_RE = re.compile(rb'//[^\n]*|"[^"]*"|[A-Za-z_]\w*|->|[;{}(),.:]')
+
+def tokenize(source):
+    # `source` is any bytes-like object, e.g. an mmap of the input file.
+    # Equal lexemes share one immutable Token, so each distinct lexeme is
+    # decoded only once.
+    cache = _FIXED_TOKENS.copy()
+    # The exactly-sized list from findall doubles as the token list: tokens
+    # overwrite the lexemes in place (never ahead of the loop, since comments
+    # only shrink it) and the unused tail is replaced by the closing EOF token
+    tokens = _TOKEN_RE.findall(source)
+    count = 0
+    for lexeme in tokens:
+        token = cache.get(lexeme)
+        if token is None:
+            first = lexeme[0]
+            if first == _SLASH:
+                continue  # Comment
+            tid = T_STRING if first == _QUOTE else T_IDENT
+            token = cache[lexeme] = Token(tid, lexeme.decode())
+        tokens[count] = token
+        count += 1
+    tokens[count:] = [_EOF_TOKEN]
+    return tokens
+
+# The files whose code determines the compiler's output; the build cache is
+# keyed on them
+_COMPILER_FILES = [__file__]
+
+# Prefer the Cython build of the lexer (`make lexer`) when it is available
+try:
+    import _lexer
+except ImportError:
+    pass
+else:
+    _c_tokenize = _lexer.tokenize
+    _COMPILER_FILES.append(_lexer.__file__)
     
-    def get_next_token(self):
-        while self.current_char is not None:
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            
-            if self.current_char == '/' and self.pos + 1 < len(self.source) and self.source[self.pos+1] == '/':
-                while self.current_char is not None and self.current_char != '\n':
-                    self.advance()
-                continue
-            
-            if self.current_char.isalpha() or self.current_char == '_':
-                ident = self.get_identifier()
-                if ident in self.KEYWORDS:
-                    return Token(ident.upper(), ident)
-                return Token('IDENT', ident)
-            
-            if self.current_char == '"':
-                return Token('STRING', self.get_string())
-            
-            if self.current_char in {';', '{', '}', '(', ')', ',', '.', ':'}:
-                char = self.current_char
-                self.advance()
-                return Token(char, char)
-            
-            self.advance()
-        
-        return Token('EOF', '')
+    def tokenize(source):
+        tokens = _c_tokenize(source, Token, _PUNCT_TOKENS, _KW_TOKENS, T_IDENT, T_STRING)
+        tokens.append(_EOF_TOKEN)
+        return tokens
 
 # --- Parser ---
 class Parser:
+    # Each parse_* method takes the position of its first token and returns
+    # the parsed node with the position just past it, so the hot loops work
+    # on locals instead of re-reading parser attributes per token.
     def __init__(self, tokens):
+        # A trailing EOF sentinel means tokens[pos] never runs off the end;
+        # tokenize() output already ends with one, so it is used as is
+        if not tokens or tokens[-1].tid != T_EOF:
+            tokens = [*tokens, _EOF_TOKEN]
         self.tokens = tokens
         self.pos = 0
-        self.current_token = self.tokens[self.pos] if self.tokens else Token('EOF', '')
-    
-    def advance(self):
-        self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
-        else:
-            self.current_token = Token('EOF', '')
     
-    def expect(self, expected_type):
-        if (self.current_token.type == expected_type or 
-            self.current_token.value == expected_type):
-            token = self.current_token
-            self.advance()
-            return token
-        raise SyntaxError(f"Expected {expected_type}, got {self.current_token}")
+    def expect(self, pos, tid):
+        token = self.tokens[pos]
+        if token.tid != tid:
+            raise SyntaxError(f"Expected {TOKEN_NAMES[tid]}, got {token}")
+        return token.value
     
     def parse(self):
-        return self.parse_module()
+        module, self.pos = self.parse_module(self.pos)
+        return module
     
-    def parse_module(self):
-        self.expect('module')
-        name = self.expect('IDENT').value
-        self.expect(';')
+    def parse_module(self, pos):
+        tokens = self.tokens
+        expect = self.expect
+        expect(pos, T_MODULE)
+        name = expect(pos + 1, T_IDENT)
+        expect(pos + 2, T_SEMI)
+        pos += 3
         
         imports = []
-        while self.current_token.value == 'import':
-            imports.append(self.parse_import())
+        while tokens[pos].tid == T_IMPORT:
+            path, pos = self.parse_import(pos)
+            imports.append(path)
         
         functions = []
-        while self.current_token.value == 'func':
-            functions.append(self.parse_function())
+        while tokens[pos].tid == T_FUNC:
+            func, pos = self.parse_function(pos)
+            functions.append(func)
         
-        return Module(name, imports, functions)
+        return Module(name, imports, functions), pos
     
-    def parse_import(self):
-        self.expect('import')
-        path = []
-        path.append(self.expect('IDENT').value)
+    def parse_import(self, pos):
+        tokens = self.tokens
+        expect = self.expect
+        expect(pos, T_IMPORT)
+        path = [expect(pos + 1, T_IDENT)]
+        pos += 2
         
-        while self.current_token.value == '.':
-            self.expect('.')
-            path.append(self.expect('IDENT').value)
+        while tokens[pos].tid == T_DOT:
+            path.append(expect(pos + 1, T_IDENT))
+            pos += 2
         
-        self.expect(';')
-        return '.'.join(path)
+        expect(pos, T_SEMI)
+        return '.'.join(path), pos + 1
     
-    def parse_function(self):
-        self.expect('func')
-        name = self.expect('IDENT').value
-        self.expect('(')
+    def parse_function(self, pos):
+        tokens = self.tokens
+        expect = self.expect
+        expect(pos, T_FUNC)
+        name = expect(pos + 1, T_IDENT)
+        expect(pos + 2, T_LPAREN)
+        pos += 3
         
         params = []
-        while self.current_token.value != ')':
-            param_name = self.expect('IDENT').value
-            self.expect(':')
-            param_type = self.expect('IDENT').value
+        while tokens[pos].tid != T_RPAREN:
+            param_name = expect(pos, T_IDENT)
+            expect(pos + 1, T_COLON)
+            param_type = expect(pos + 2, T_IDENT)
             params.append((param_name, param_type))
-            if self.current_token.value == ',':
-                self.expect(',')
-        
-        self.expect(')')
+            pos += 3
+            if tokens[pos].tid == T_COMMA:
+                pos += 1
+        pos += 1  # ')'
         
         returns = 'void'
-        if self.current_token.value == '->':
-            self.expect('->')
-            returns = self.expect('IDENT').value
+        if tokens[pos].tid == T_ARROW:
+            returns = expect(pos + 1, T_IDENT)
+            pos += 2
         
-        self.expect('{')
+        expect(pos, T_LBRACE)
+        pos += 1
         body = []
-        while self.current_token.value != '}':
-            body.append(self.parse_statement())
-        self.expect('}')
+        while tokens[pos].tid != T_RBRACE:
+            stmt, pos = self.parse_statement(pos)
+            body.append(stmt)
+        pos += 1  # '}'
         
-        return Function(name, params, returns, body)
+        return Function(name, params, returns, body), pos
     
-    def parse_statement(self):
-        if self.current_token.value == 'return':
-            return self.parse_return()
-        elif self.current_token.type == 'IDENT' and self.peek().value == '(':
-            return self.parse_call()
+    def parse_statement(self, pos):
+        tokens = self.tokens
+        token = tokens[pos]
+        if token.tid == T_RETURN:
+            return self.parse_return(pos)
+        elif token.tid == T_IDENT and tokens[pos + 1].tid == T_LPAREN:
+            return self.parse_call(pos)
         else:
-            raise SyntaxError(f"Unexpected token: {self.current_token}")
-    
-    def peek(self):
-        if self.pos + 1 < len(self.tokens):
-            return self.tokens[self.pos + 1]
-        return Token('EOF', '')
+            raise SyntaxError(f"Unexpected token: {token}")
     
-    def parse_call(self):
-        func = self.expect('IDENT').value
-        self.expect('(')
+    def parse_call(self, pos):
+        # parse_statement has already matched the IDENT '(' prefix
+        tokens = self.tokens
+        func = tokens[pos].value
+        pos += 2
         args = []
-        while self.current_token.value != ')':
-            args.append(self.parse_expression())
-            if self.current_token.value == ',':
-                self.expect(',')
-        self.expect(')')
-        self.expect(';')
-        return Call(func, args)
+        while tokens[pos].tid != T_RPAREN:
+            arg, pos = self.parse_expression(pos)
+            args.append(arg)
+            if tokens[pos].tid == T_COMMA:
+                pos += 1
+        self.expect(pos + 1, T_SEMI)
+        return Call(func, args), pos + 2
     
-    def parse_expression(self):
-        if self.current_token.type == 'STRING':
-            return StringLiteral(self.expect('STRING').value)
+    def parse_expression(self, pos):
+        token = self.tokens[pos]
+        if token.tid == T_STRING:
+            return StringLiteral(token.value), pos + 1
         else:
             raise NotImplementedError("Complex expressions not implemented yet")
     
-    def parse_return(self):
-        self.expect('return')
-        expr = self.parse_expression()
-        self.expect(';')
-        return Return(expr)
+    def parse_return(self, pos):
+        self.expect(pos, T_RETURN)
+        expr, pos = self.parse_expression(pos + 1)
+        self.expect(pos, T_SEMI)
+        return Return(expr), pos + 1
 
 # --- Code Generator ---
+# Indentation prefix per nesting level, built once instead of per line
+_INDENTS = ['    ' * i for i in range(32)]
+
 class CodeGenerator:
-    def __init__(self):
-        self.output = []
+    TYPE_MAP = {
+        'int': 'int',
+        'void': 'void',
+        'word': 'size_t',
+        'ptr': 'void*'
+    }
+    
+    # Forward declarations provided by the runtime for each import
+    IMPORT_DECLS = {
+        'std.io': 'void std_io_print(const char* msg);'
+    }
+    
+    def __init__(self, out):
+        # Lines are written straight to `out` (any text file-like object)
+        # rather than collected and joined at the end
+        self._write = out.write
         self.indent = 0
     
     def generate(self, module):
@@ -240,9 +281,11 @@ class CodeGenerator:
         self.emit('')
         
         # Generate forward declarations for imports
+        import_decls = self.IMPORT_DECLS
         for imp in module.imports:
-            if imp == 'std.io':
-                self.emit('void std_io_print(const char* msg);')
+            decl = import_decls.get(imp)
+            if decl is not None:
+                self.emit(decl)
         
         self.emit('')
         
@@ -250,42 +293,38 @@ class CodeGenerator:
             self.generate_function(func)
     
     def generate_function(self, func):
-        type_map = {
-            'int': 'int',
-            'void': 'void',
-            'word': 'size_t',
-            'ptr': 'void*'
-        }
-        
+        type_map = self.TYPE_MAP
         return_type = type_map.get(func.returns, 'int')
-        params = []
-        for name, typ in func.params:
-            c_type = type_map.get(typ, 'int')
-            params.append(f"{c_type} {name}")
+        params = ', '.join(['%s %s' % (type_map.get(typ, 'int'), name)
+                            for name, typ in func.params])
         
-        self.emit(f"{return_type} {func.name}({', '.join(params)}) {{")
+        self.emit('%s %s(%s) {' % (return_type, func.name, params))
         self.indent += 1
         
+        generate_statement = self.generate_statement
         for stmt in func.body:
-            self.generate_statement(stmt)
+            generate_statement(stmt)
         
         self.indent -= 1
         self.emit('}')
         self.emit('')
     
     def generate_statement(self, stmt):
-        if isinstance(stmt, Call):
-            self.generate_call(stmt)
-        elif isinstance(stmt, Return):
-            self.generate_return(stmt)
+        handler = self.STATEMENT_HANDLERS.get(type(stmt))
+        if handler is not None:
+            handler(self, stmt)
     
     def generate_call(self, call):
-        if call.func == 'print':
-            self.emit(f'printf({call.args[0].value});')
+        builtin = self.BUILTINS.get(call.func)
+        if builtin is not None:
+            builtin(self, call)
         else:
-            args = ', '.join(arg.value for arg in call.args)
+            args = ', '.join([arg.value for arg in call.args])
             self.emit(f'{call.func}({args});')
     
+    def generate_print(self, call):
+        self.emit(f'printf({call.args[0].value});')
+    
     def generate_return(self, ret):
         if isinstance(ret.value, StringLiteral):
             self.emit(f'return {ret.value.value};')
@@ -293,57 +332,198 @@ class CodeGenerator:
             self.emit(f'return {ret.value};')
     
     def emit(self, line):
-        self.output.append('    ' * self.indent + line)
+        write = self._write
+        write(_INDENTS[self.indent])
+        write(line)
+        write('\n')
+    
+    # Dispatch tables, keyed by statement node type and by the name of a
+    # call that is compiled inline rather than as a plain C call
+    STATEMENT_HANDLERS = {
+        Call: generate_call,
+        Return: generate_return
+    }
     
-    def get_code(self):
-        return '\n'.join(self.output)
+    BUILTINS = {
+        'print': generate_print
+    }
 
 # --- Compiler Driver ---
+# Executables are cached here, keyed by a hash of everything they are built from
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'rerec')
+# Once the cache grows past this many bytes, the least recently used
+# executables are removed
+CACHE_MAX_SIZE = 256 << 20
+
 class RereCompiler:
     def __init__(self):
         self.verbose = False
+        self.release = False
+        self.use_cache = True
     
-    def compile_to_executable(self, source_file, output_file=None):
+    def compile_to_executable(self, source_files, output_file=None):
+        # Several modules are linked into one executable with a single
+        # C compiler run
+        if isinstance(source_files, str):
+            source_files = [source_files]
         if not output_file:
             output_file = 'a.out'
         
-        # Step 1: Compile to C
-        c_file = source_file.replace('.rere', '.c')
-        self.compile_to_c(source_file, c_file)
-        
-        # Step 2: Compile C to executable
         runtime_obj = 'build/rere_runtime.o'
-        cmd = [
-            'gcc', 
-            '-Wall', 
-            '-Wextra', 
+        # Development builds skip optimisation, and skip the warning passes
+        # unless someone is reading the output. $CC (e.g. tcc, or a command
+        # such as "ccache gcc") may replace gcc.
+        optimize = ['-O2', '-flto'] if self.release else ['-O0']
+        warnings = ['-Wall', '-Wextra'] if self.verbose else ['-w']
+        cc_flags = [
+            *(shlex.split(os.environ.get('CC', '')) or ['gcc']),
             '-std=c11',
-            c_file,
-            runtime_obj,
-            '-o', 
-            output_file
+            '-pipe',
+            *optimize,
+            *warnings
         ]
         
+        # An unchanged build is copied out of the cache. Verbose builds skip
+        # the cache so that every stage still runs and is reported.
+        cached = None
+        if self.use_cache and not self.verbose:
+            cached = self.cache_path(source_files, cc_flags, runtime_obj)
+            if cached and os.path.exists(cached):
+                # Content and mode only: the output gets a fresh mtime, just
+                # as a real build would leave it
+                shutil.copy(cached, output_file)
+                # Mark the entry as recently used for cache pruning
+                with contextlib.suppress(OSError):
+                    os.utime(cached)
+                print(f"Successfully compiled to {output_file}")
+                return
+        
+        if self.verbose:
+            # Step 1: Compile to C, kept on disk for inspection. All modules
+            # go into one file, the same translation unit gcc is piped below.
+            c_file = source_files[0].replace('.rere', '.c')
+            self.compile_to_c(source_files, c_file)
+            c_input = [c_file]
+        else:
+            # The C code is generated straight into gcc's stdin. '-x none'
+            # stops the runtime object being read as C source.
+            c_input = ['-x', 'c', '-', '-x', 'none']
+        
+        # Step 2: Compile C to executable
+        cmd = [*cc_flags, *c_input, runtime_obj, '-o', output_file]
+        
         if self.verbose:
             print('Executing:', ' '.join(cmd))
+            returncode = subprocess.run(cmd).returncode
+        else:
+            returncode = self.pipe_to_gcc(source_files, cmd)
         
-        result = subprocess.run(cmd)
-        if result.returncode != 0:
+        if returncode != 0:
             raise RuntimeError("Compilation to executable failed")
         
+        if cached:
+            self.store_cached(output_file, cached)
+        
         print(f"Successfully compiled to {output_file}")
     
-    def compile_to_c(self, source_file, output_file):
-        with open(source_file, 'r') as f:
-            source = f.read()
-        
-        lexer = Lexer(source)
-        tokens = []
-        while True:
-            token = lexer.get_next_token()
-            if token.type == 'EOF':
+    def cache_path(self, source_files, cc_flags, runtime_obj):
+        # The key covers the text of every source, the C compiler command
+        # line, and the mtime and size of this compiler (including the Cython
+        # lexer when it is loaded), of the C compiler binary that command
+        # resolves to, and of the runtime object
+        key = hashlib.blake2b(digest_size=16)
+        cc_path = shutil.which(cc_flags[0])
+        if cc_path is None:
+            return None  # Not cacheable; let the build report what is missing
+        try:
+            for source_file in source_files:
+                # Hashed through a mapping, as parse_file reads it, rather
+                # than copied into memory
+                with open(source_file, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    key.update(b'%d;' % size)
+                    if size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                            key.update(source)
+            key.update('\0'.join(cc_flags).encode())
+            for path in (*_COMPILER_FILES, cc_path, runtime_obj):
+                st = os.stat(path)
+                key.update(b'%d:%d;' % (st.st_mtime_ns, st.st_size))
+        except OSError:
+            return None
+        return os.path.join(CACHE_DIR, key.hexdigest())
+    
+    def store_cached(self, output_file, cached):
+        # Caching is best effort; the build itself has already succeeded.
+        # The copy is renamed into place so readers never see a partial file.
+        tmp_file = f'{cached}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            shutil.copy2(output_file, tmp_file)
+            os.replace(tmp_file, cached)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
+            return
+        self.prune_cache()
+    
+    def prune_cache(self):
+        # Entries are ordered by mtime, which a cache hit refreshes, and the
+        # oldest are removed until the cache fits in CACHE_MAX_SIZE. Other
+        # builds' in-progress '.tmp' files are left alone.
+        entries = []
+        total = 0
+        try:
+            with os.scandir(CACHE_DIR) as it:
+                for entry in it:
+                    if '.' not in entry.name:
+                        st = entry.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                        total += st.st_size
+        except OSError:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= CACHE_MAX_SIZE:
                 break
-            tokens.append(token)
+            with contextlib.suppress(OSError):
+                os.remove(path)
+            total -= size
+    
+    def pipe_to_gcc(self, source_files, cmd):
+        # gcc is started before any source is parsed so that its startup
+        # overlaps with the front end, then fed the generated C of every
+        # module over one pipe. The modules form a single translation unit,
+        # so the C headers are parsed once rather than once per module.
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, encoding='utf-8',
+                                bufsize=1 << 20)
+        gen = CodeGenerator(proc.stdin)
+        try:
+            for source_file in source_files:
+                ast = self.parse_file(source_file)
+                # If gcc exits early its exit status is what gets reported
+                with contextlib.suppress(BrokenPipeError):
+                    gen.generate(ast)
+        except BaseException:
+            proc.kill()
+            with contextlib.suppress(BrokenPipeError):
+                proc.stdin.close()
+            proc.wait()
+            raise
+        
+        with contextlib.suppress(BrokenPipeError):
+            proc.stdin.close()
+        return proc.wait()
+    
+    def parse_file(self, source_file):
+        # Map the file instead of reading it into a str; tokens copy out only
+        # the text they need
+        with open(source_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                    tokens = tokenize(source)
+            else:
+                tokens = [_EOF_TOKEN]
         
         if self.verbose:
             print("Tokens:", tokens)
@@ -354,12 +534,17 @@ class RereCompiler:
         if self.verbose:
             print("AST:", ast)
         
-        gen = CodeGenerator()
-        gen.generate(ast)
-        c_code = gen.get_code()
+        return ast
+    
+    def compile_to_c(self, source_files, output_file):
+        if isinstance(source_files, str):
+            source_files = [source_files]
+        asts = [self.parse_file(source_file) for source_file in source_files]
         
-        with open(output_file, 'w') as f:
-            f.write(c_code)
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            gen = CodeGenerator(f)
+            for ast in asts:
+                gen.generate(ast)
         
         if self.verbose:
             print(f"Generated C code saved to {output_file}")
@@ -367,16 +552,22 @@ class RereCompiler:
 # --- Main ---
 def main():
     parser = argparse.ArgumentParser(description='Rerechan02 Compiler')
-    parser.add_argument('input', help='Input .rere file')
+    parser.add_argument('inputs', nargs='+', metavar='input', help='Input .rere files')
     parser.add_argument('-o', '--output', help='Output executable (default: a.out)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('--release', action='store_true', help='Optimized build (-O2 -flto)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always rebuild, ignoring cached executables (kept in '
+                             '$XDG_CACHE_HOME/rerec or ~/.cache/rerec; delete it to clear them)')
     args = parser.parse_args()
     
     compiler = RereCompiler()
     compiler.verbose = args.verbose
+    compiler.release = args.release
+    compiler.use_cache = not args.no_cache
     
     try:
-        compiler.compile_to_executable(args.input, args.output)
+        compiler.compile_to_executable(args.inputs, args.output)
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)